@@ -0,0 +1,120 @@
+import os
+import sys
+# Same path setup as Main.py so the src.* imports resolve
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+
+import argparse
+import time
+from datetime import datetime, timedelta
+from flask import Flask
+from flask.json.provider import DefaultJSONProvider
+from src.models.user import db, User
+from src.models.order import Order, ORDER_ROW_ENCODER
+from src.models.trade import Trade, TRADE_ROW_ENCODER
+from src.utils.encoding import FastJSONProvider, orjson
+
+# Compares encoding paths for list responses on an in-memory database. Every
+# path gets the same with_row_entities result rows, so only encoding is timed:
+# dicts built from the rows and passed to a provider, against RowEncoder.
+# Usage: python BenchEncoding.py [--rows N] [--repeat N]
+
+
+def create_app():
+    app = Flask(__name__)
+    app.json = FastJSONProvider(app)
+    app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite://'
+    app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+    db.init_app(app)
+    return app
+
+
+def seed(rows):
+    users = [User(username=f'user{i}', email=f'user{i}@example.com') for i in range(50)]
+    db.session.add_all(users)
+    db.session.flush()
+
+    now = datetime.utcnow()
+    orders = []
+    for i in range(rows):
+        orders.append(Order(
+            user_id=users[i % len(users)].id,
+            order_type='buy' if i % 2 else 'sell',
+            cryptocurrency='BTC',
+            fiat_currency='USD',
+            amount=0.5 + i % 7,
+            price_per_unit=67234.5,
+            total_value=(0.5 + i % 7) * 67234.5,
+            payment_method='Bank Transfer',
+            created_at=now - timedelta(seconds=i),
+            updated_at=now - timedelta(seconds=i)
+        ))
+    db.session.add_all(orders)
+    db.session.flush()
+
+    trades = []
+    for i in range(rows):
+        trades.append(Trade(
+            order_id=orders[i].id,
+            buyer_id=users[i % len(users)].id,
+            seller_id=users[(i + 1) % len(users)].id,
+            amount=0.5,
+            price_per_unit=67234.5,
+            total_value=33617.25,
+            status='pending',
+            escrow_address=f'escrow_{i:016x}',
+            created_at=now - timedelta(seconds=i),
+            updated_at=now - timedelta(seconds=i)
+        ))
+    db.session.add_all(trades)
+    db.session.commit()
+
+
+def best_of(fn, repeat):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def bench(app, model, encoder, key, repeat):
+    rows = model.with_row_entities(model.query).order_by(model.created_at.desc()).all()
+    stdlib_provider = DefaultJSONProvider(app)
+
+    paths = [
+        ('dicts + stdlib provider', lambda: stdlib_provider.response(
+            {key: encoder.to_dicts(rows), 'success': True}).get_data()),
+        ('RowEncoder stdlib', lambda: encoder.encode_stdlib(key, rows))
+    ]
+    if orjson is not None:
+        paths += [
+            ('dicts + orjson provider', lambda: app.json.response(
+                {key: encoder.to_dicts(rows), 'success': True}).get_data()),
+            ('RowEncoder orjson', lambda: encoder.encode_orjson(key, rows, default=app.json.default))
+        ]
+
+    print(f"{key} ({len(rows)} rows)")
+    for name, fn in paths:
+        print(f"  {name:<26} {best_of(fn, repeat) * 1000:8.2f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Compare list endpoint JSON encoding paths')
+    parser.add_argument('--rows', type=int, default=5000)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    app = create_app()
+    with app.test_request_context():
+        db.create_all()
+        seed(args.rows)
+
+        if orjson is None:
+            print("orjson not installed, timing stdlib paths only")
+        bench(app, Order, ORDER_ROW_ENCODER, 'orders', args.repeat)
+        bench(app, Trade, TRADE_ROW_ENCODER, 'trades', args.repeat)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,147 @@
+from flask import current_app
+from flask.json.provider import DefaultJSONProvider
+from datetime import datetime
+from json.encoder import encode_basestring
+
+try:
+    import orjson
+except ImportError:  # optional, falls back to the stdlib json module
+    orjson = None
+
+
+def orjson_options(sort_keys, indent, passthrough_datetime=True):
+    option = orjson.OPT_NON_STR_KEYS
+    if passthrough_datetime:
+        # Route datetimes through the provider's default so output matches the stdlib provider
+        option |= orjson.OPT_PASSTHROUGH_DATETIME
+    if sort_keys:
+        option |= orjson.OPT_SORT_KEYS
+    if indent:
+        option |= orjson.OPT_INDENT_2
+    return option
+
+
+def wants_indent(app):
+    """Same rule DefaultJSONProvider.response uses for pretty-printing"""
+    compact = getattr(app.json, 'compact', None)
+    return (compact is None and app.debug) or compact is False
+
+
+class FastJSONProvider(DefaultJSONProvider):
+    """Flask JSON provider that uses orjson when installed, stdlib json otherwise"""
+
+    def dumps(self, obj, **kwargs):
+        if orjson is None:
+            return super().dumps(obj, **kwargs)
+
+        option = orjson_options(kwargs.get('sort_keys', self.sort_keys), kwargs.get('indent'))
+        return orjson.dumps(obj, default=kwargs.get('default', self.default), option=option).decode()
+
+    def loads(self, s, **kwargs):
+        if orjson is None:
+            return super().loads(s, **kwargs)
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        if orjson is None:
+            return super().response(*args, **kwargs)
+
+        obj = self._prepare_response_obj(args, kwargs)
+        option = orjson_options(self.sort_keys, wants_indent(self._app)) | orjson.OPT_APPEND_NEWLINE
+        return self._app.response_class(
+            orjson.dumps(obj, default=self.default, option=option),
+            mimetype=self.mimetype
+        )
+
+
+def _encode_bool(value):
+    return 'true' if value else 'false'
+
+
+def _encode_datetime(value):
+    return '"' + value.isoformat() + '"'
+
+
+# Per-column value encoders for the stdlib path; None is handled before dispatch
+COLUMN_ENCODERS = {
+    'int': repr,
+    'float': repr,
+    'str': encode_basestring,
+    'bool': _encode_bool,
+    'datetime': _encode_datetime
+}
+
+
+class RowEncoder:
+    """Encodes SQL result tuples for list responses without going through ORM objects.
+
+    columns is a list of (column, key, kind) triples; kind is one of the
+    COLUMN_ENCODERS keys. The same list drives the select (self.columns), so
+    selected values and JSON keys cannot drift apart.
+
+    With orjson installed rows are zipped into dicts and encoded in C, with
+    datetimes encoded natively (identical to isoformat() for naive values).
+    Otherwise each row is built from precomputed '"key":' fragments.
+    """
+
+    def __init__(self, columns):
+        self.columns = [column for column, _, _ in columns]
+        self.keys = [key for _, key, _ in columns]
+        self.kinds = [kind for _, _, kind in columns]
+        self.plans = {
+            False: self._plan(range(len(columns))),
+            True: self._plan(sorted(range(len(columns)), key=self.keys.__getitem__))
+        }
+
+    def _plan(self, order):
+        # Precompute '{"id":' / ',"user_id":' so each row is a single join
+        return [
+            (i, ('{' if n == 0 else ',') + encode_basestring(self.keys[i]) + ':', COLUMN_ENCODERS[self.kinds[i]])
+            for n, i in enumerate(order)
+        ]
+
+    def encode_row(self, row, sort_keys=False):
+        return ''.join([
+            prefix + ('null' if row[i] is None else encode(row[i]))
+            for i, prefix, encode in self.plans[sort_keys]
+        ]) + '}'
+
+    def encode_stdlib(self, key, rows, sort_keys=True):
+        items = '[' + ','.join([self.encode_row(row, sort_keys) for row in rows]) + ']'
+
+        listing = encode_basestring(key) + ':' + items
+        if sort_keys and key > 'success':
+            body = '{"success":true,' + listing + '}\n'
+        else:
+            body = '{' + listing + ',"success":true}\n'
+        return body.encode('utf-8')
+
+    def encode_orjson(self, key, rows, sort_keys=True, indent=False, default=None):
+        keys = self.keys
+        obj = {key: [dict(zip(keys, row)) for row in rows], 'success': True}
+        option = orjson_options(sort_keys, indent, passthrough_datetime=False) | orjson.OPT_APPEND_NEWLINE
+        return orjson.dumps(obj, default=default, option=option)
+
+    def to_dicts(self, rows):
+        """Plain dicts matching the model's to_dict output, for the provider's own encoder"""
+        keys = self.keys
+        return [
+            {k: (v.isoformat() if isinstance(v, datetime) else v) for k, v in zip(keys, row)}
+            for row in rows
+        ]
+
+    def response(self, key, rows):
+        """Build a {"<key>": [...], "success": true} response honouring app.json's settings"""
+        provider = current_app.json
+        sort_keys = getattr(provider, 'sort_keys', True)
+        indent = wants_indent(current_app)
+
+        if orjson is not None:
+            body = self.encode_orjson(key, rows, sort_keys, indent, getattr(provider, 'default', None))
+        elif indent:
+            # Debug pretty-printing is rare; let the provider do it
+            return provider.response({key: self.to_dicts(rows), 'success': True})
+        else:
+            body = self.encode_stdlib(key, rows, sort_keys)
+
+        return current_app.response_class(body, mimetype=provider.mimetype)
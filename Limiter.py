@@ -0,0 +1,206 @@
+from flask import Blueprint, request, jsonify, g, current_app
+from collections import OrderedDict
+import math
+import threading
+import time
+
+limiter_bp = Blueprint('limiter', __name__)
+
+# Defaults, overridable through app.config
+DEFAULT_CONFIG = {
+    'RATELIMIT_ENABLED': True,
+    'RATELIMIT_READ_RATE': 20.0,      # tokens per second, per client
+    'RATELIMIT_READ_BURST': 40,
+    'RATELIMIT_WRITE_RATE': 2.0,      # tokens per second, per client
+    'RATELIMIT_WRITE_BURST': 5,
+    'RATELIMIT_MAX_INFLIGHT_WRITES': 4,
+    'RATELIMIT_WRITE_QUEUE_TIMEOUT': 0.05,  # seconds to wait for a write slot
+    'RATELIMIT_MAX_BUCKETS': 10000
+}
+
+READ_METHODS = ('GET', 'HEAD')
+
+
+class TokenBucket:
+    """Classic token bucket; not thread-safe on its own, guarded by the limiter lock"""
+
+    __slots__ = ('rate', 'capacity', 'tokens', 'updated_at')
+
+    def __init__(self, rate, capacity, now):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = float(capacity)
+        self.updated_at = now
+
+    def take(self, now):
+        """Consume one token. Returns seconds to wait before retrying, 0 if admitted."""
+        elapsed = now - self.updated_at
+        if elapsed > 0:
+            self.tokens = min(self.capacity, self.tokens + elapsed * self.rate)
+            self.updated_at = now
+
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return 0
+
+        return (1 - self.tokens) / self.rate
+
+    def refund(self):
+        """Give back a token taken for a request that was rejected for another reason"""
+        self.tokens = min(self.capacity, self.tokens + 1)
+
+    def is_full(self, now):
+        return self.tokens + (now - self.updated_at) * self.rate >= self.capacity
+
+
+class AdmissionController:
+    """Per-client token buckets split by endpoint class plus a global cap on in-flight writes"""
+
+    def __init__(self, app=None):
+        self.lock = threading.Lock()
+        # Least recently used first, the fallback eviction order when every bucket is throttled
+        self.buckets = OrderedDict()
+        self.metrics = {
+            'admitted_read': 0,
+            'admitted_write': 0,
+            'rejected_rate_read': 0,
+            'rejected_rate_write': 0,
+            'rejected_concurrency': 0,
+            'inflight_writes': 0,
+            'peak_inflight_writes': 0
+        }
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        for key, value in DEFAULT_CONFIG.items():
+            app.config.setdefault(key, value)
+
+        self.config = app.config
+        self.write_slots = threading.BoundedSemaphore(app.config['RATELIMIT_MAX_INFLIGHT_WRITES'])
+
+        app.extensions['admission_controller'] = self
+        app.before_request(self.before_request)
+        app.teardown_request(self.teardown_request)
+
+    def client_key(self):
+        """Identify the caller by remote address.
+
+        User ids in the URL name the resource, not the caller, and ids in the
+        body are client-controlled, so neither is safe to key on. Deploy behind
+        werkzeug's ProxyFix if a reverse proxy sits in front of the app.
+        """
+        return f"ip:{request.remote_addr}"
+
+    def bucket(self, endpoint_class, key, now):
+        """Return the bucket for key, creating it if needed. Caller holds the lock."""
+        bucket_key = (endpoint_class, key)
+        bucket = self.buckets.get(bucket_key)
+        if bucket is not None:
+            self.buckets.move_to_end(bucket_key)
+            return bucket
+
+        if len(self.buckets) >= self.config['RATELIMIT_MAX_BUCKETS']:
+            self.prune(now)
+
+        if endpoint_class == 'write':
+            rate = self.config['RATELIMIT_WRITE_RATE']
+            burst = self.config['RATELIMIT_WRITE_BURST']
+        else:
+            rate = self.config['RATELIMIT_READ_RATE']
+            burst = self.config['RATELIMIT_READ_BURST']
+
+        bucket = self.buckets[bucket_key] = TokenBucket(rate, burst, now)
+        return bucket
+
+    def take_token(self, endpoint_class, key):
+        now = time.monotonic()
+        with self.lock:
+            return self.bucket(endpoint_class, key, now).take(now)
+
+    def refund_token(self, endpoint_class, key):
+        with self.lock:
+            bucket = self.buckets.get((endpoint_class, key))
+            if bucket is not None:
+                bucket.refund()
+
+    def prune(self, now):
+        """Evict buckets that have refilled completely; they carry no state worth keeping.
+
+        If every bucket is still draining, only the single least recently used
+        one is evicted, so throttled callers cannot be reset en masse.
+        """
+        full = [key for key, bucket in self.buckets.items() if bucket.is_full(now)]
+        for key in full:
+            del self.buckets[key]
+
+        if not full and self.buckets:
+            self.buckets.popitem(last=False)
+
+    def count(self, name, delta=1):
+        with self.lock:
+            self.metrics[name] += delta
+
+    def reject(self, error, retry_after, metric):
+        self.count(metric)
+        response = jsonify({'success': False, 'error': error})
+        response.status_code = 429
+        response.headers['Retry-After'] = str(max(1, math.ceil(retry_after)))
+        return response
+
+    def before_request(self):
+        if not self.config['RATELIMIT_ENABLED']:
+            return None
+        if request.method == 'OPTIONS' or not request.path.startswith('/api/'):
+            return None
+        if request.endpoint == 'limiter.get_limiter_metrics':
+            return None
+
+        endpoint_class = 'read' if request.method in READ_METHODS else 'write'
+        key = self.client_key()
+        retry_after = self.take_token(endpoint_class, key)
+        if retry_after:
+            return self.reject('Rate limit exceeded', retry_after, f'rejected_rate_{endpoint_class}')
+
+        if endpoint_class == 'write':
+            # Shed load quickly instead of queueing behind the single SQLite writer
+            if not self.write_slots.acquire(timeout=self.config['RATELIMIT_WRITE_QUEUE_TIMEOUT']):
+                # Overload is not the caller's fault, don't charge them for it
+                self.refund_token(endpoint_class, key)
+                return self.reject('Server busy, too many concurrent writes', 1, 'rejected_concurrency')
+
+            g.holds_write_slot = True
+            with self.lock:
+                self.metrics['inflight_writes'] += 1
+                self.metrics['peak_inflight_writes'] = max(
+                    self.metrics['peak_inflight_writes'], self.metrics['inflight_writes']
+                )
+
+        self.count(f'admitted_{endpoint_class}')
+        return None
+
+    def teardown_request(self, exc):
+        if g.pop('holds_write_slot', False):
+            self.count('inflight_writes', -1)
+            self.write_slots.release()
+
+    def snapshot(self):
+        with self.lock:
+            metrics = dict(self.metrics)
+            metrics['tracked_buckets'] = len(self.buckets)
+
+        metrics['max_inflight_writes'] = self.config['RATELIMIT_MAX_INFLIGHT_WRITES']
+        return metrics
+
+
+@limiter_bp.route('/limiter/metrics', methods=['GET'])
+def get_limiter_metrics():
+    """Get admission control counters"""
+    try:
+        controller = current_app.extensions['admission_controller']
+        return jsonify({
+            'success': True,
+            'metrics': controller.snapshot()
+        })
+    except Exception as e:
+        return jsonify({'success': False, 'error': str(e)}), 500
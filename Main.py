@@ -10,10 +10,15 @@ from src.routes.user import user_bp
 from src.routes.orders import orders_bp
 from src.routes.trades import trades_bp
 from src.routes.markets import markets_bp
+from src.routes.limiter import limiter_bp, AdmissionController
+from src.utils.encoding import FastJSONProvider
 
 app = Flask(__name__, static_folder=os.path.join(os.path.dirname(__file__), 'static'))
 app.config['SECRET_KEY'] = 'asdf#FGSgvasgf$5$WGT'
 
+# orjson-backed when installed, stdlib json otherwise
+app.json = FastJSONProvider(app)
+
 # Enable CORS for all routes
 CORS(app)
 
@@ -21,6 +26,10 @@ app.register_blueprint(user_bp, url_prefix='/api')
 app.register_blueprint(orders_bp, url_prefix='/api')
 app.register_blueprint(trades_bp, url_prefix='/api')
 app.register_blueprint(markets_bp, url_prefix='/api')
+app.register_blueprint(limiter_bp, url_prefix='/api')
+
+# Per-user token buckets and a cap on in-flight writes to protect the SQLite writer
+AdmissionController(app)
 
 # uncomment if you need to use database
 app.config['SQLALCHEMY_DATABASE_URI'] = f"sqlite:///{os.path.join(os.path.dirname(__file__), 'database', 'app.db')}"
@@ -1,6 +1,7 @@
 from flask_sqlalchemy import SQLAlchemy
 from datetime import datetime
-from src.models.user import db
+from src.models.user import db, User
+from src.utils.encoding import RowEncoder
 
 class Order(db.Model):
     id = db.Column(db.Integer, primary_key=True)
@@ -36,3 +37,25 @@ class Order(db.Model):
             'user': self.user.username if self.user else None
         }
 
+    @classmethod
+    def with_row_entities(cls, query):
+        """Join the owner and select the columns ORDER_ROW_ENCODER encodes"""
+        return query.outerjoin(User, cls.user_id == User.id).with_entities(*ORDER_ROW_ENCODER.columns)
+
+
+# (column, key, kind) once, so the select and the JSON keys share one ordering
+ORDER_ROW_ENCODER = RowEncoder([
+    (Order.id, 'id', 'int'),
+    (Order.user_id, 'user_id', 'int'),
+    (Order.order_type, 'order_type', 'str'),
+    (Order.cryptocurrency, 'cryptocurrency', 'str'),
+    (Order.fiat_currency, 'fiat_currency', 'str'),
+    (Order.amount, 'amount', 'float'),
+    (Order.price_per_unit, 'price_per_unit', 'float'),
+    (Order.total_value, 'total_value', 'float'),
+    (Order.payment_method, 'payment_method', 'str'),
+    (Order.status, 'status', 'str'),
+    (Order.created_at, 'created_at', 'datetime'),
+    (Order.updated_at, 'updated_at', 'datetime'),
+    (User.username, 'user', 'str')
+])
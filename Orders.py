@@ -1,6 +1,6 @@
 from flask import Blueprint, request, jsonify
 from src.models.user import db, User
-from src.models.order import Order
+from src.models.order import Order, ORDER_ROW_ENCODER
 from datetime import datetime
 
 orders_bp = Blueprint('orders', __name__)
@@ -24,12 +24,10 @@ def get_orders():
         if fiat_currency:
             query = query.filter_by(fiat_currency=fiat_currency.upper())
             
-        orders = query.order_by(Order.created_at.desc()).all()
+        # Joins go last so filter_by above still targets Order
+        rows = Order.with_row_entities(query).order_by(Order.created_at.desc()).all()
         
-        return jsonify({
-            'success': True,
-            'orders': [order.to_dict() for order in orders]
-        })
+        return ORDER_ROW_ENCODER.response('orders', rows)
     except Exception as e:
         return jsonify({'success': False, 'error': str(e)}), 500
 
@@ -154,12 +152,10 @@ def get_user_orders(user_id):
         if not user:
             return jsonify({'success': False, 'error': 'User not found'}), 404
             
-        orders = Order.query.filter_by(user_id=user_id).order_by(Order.created_at.desc()).all()
+        query = Order.query.filter_by(user_id=user_id)
+        rows = Order.with_row_entities(query).order_by(Order.created_at.desc()).all()
         
-        return jsonify({
-            'success': True,
-            'orders': [order.to_dict() for order in orders]
-        })
+        return ORDER_ROW_ENCODER.response('orders', rows)
     except Exception as e:
         return jsonify({'success': False, 'error': str(e)}), 500
 
@@ -1,6 +1,8 @@
 from flask_sqlalchemy import SQLAlchemy
 from datetime import datetime
-from src.models.user import db
+from sqlalchemy.orm import aliased
+from src.models.user import db, User
+from src.utils.encoding import RowEncoder
 
 class Trade(db.Model):
     id = db.Column(db.Integer, primary_key=True)
@@ -41,3 +43,32 @@ class Trade(db.Model):
             'seller': self.seller.username if self.seller else None
         }
 
+    @classmethod
+    def with_row_entities(cls, query):
+        """Join buyer and seller and select the columns TRADE_ROW_ENCODER encodes"""
+        return query.outerjoin(TradeBuyer, cls.buyer_id == TradeBuyer.id).outerjoin(
+            TradeSeller, cls.seller_id == TradeSeller.id
+        ).with_entities(*TRADE_ROW_ENCODER.columns)
+
+
+TradeBuyer = aliased(User, name='buyer')
+TradeSeller = aliased(User, name='seller')
+
+# (column, key, kind) once, so the select and the JSON keys share one ordering
+TRADE_ROW_ENCODER = RowEncoder([
+    (Trade.id, 'id', 'int'),
+    (Trade.order_id, 'order_id', 'int'),
+    (Trade.buyer_id, 'buyer_id', 'int'),
+    (Trade.seller_id, 'seller_id', 'int'),
+    (Trade.amount, 'amount', 'float'),
+    (Trade.price_per_unit, 'price_per_unit', 'float'),
+    (Trade.total_value, 'total_value', 'float'),
+    (Trade.status, 'status', 'str'),
+    (Trade.escrow_address, 'escrow_address', 'str'),
+    (Trade.payment_confirmed, 'payment_confirmed', 'bool'),
+    (Trade.crypto_released, 'crypto_released', 'bool'),
+    (Trade.created_at, 'created_at', 'datetime'),
+    (Trade.updated_at, 'updated_at', 'datetime'),
+    (TradeBuyer.username, 'buyer', 'str'),
+    (TradeSeller.username, 'seller', 'str')
+])
@@ -1,7 +1,7 @@
 from flask import Blueprint, request, jsonify
 from src.models.user import db, User
 from src.models.order import Order
-from src.models.trade import Trade
+from src.models.trade import Trade, TRADE_ROW_ENCODER
 from datetime import datetime
 import uuid
 
@@ -23,12 +23,10 @@ def get_trades():
         if status:
             query = query.filter_by(status=status)
             
-        trades = query.order_by(Trade.created_at.desc()).all()
+        # Joins go last so filter_by above still targets Trade
+        rows = Trade.with_row_entities(query).order_by(Trade.created_at.desc()).all()
         
-        return jsonify({
-            'success': True,
-            'trades': [trade.to_dict() for trade in trades]
-        })
+        return TRADE_ROW_ENCODER.response('trades', rows)
     except Exception as e:
         return jsonify({'success': False, 'error': str(e)}), 500
 
@@ -0,0 +1,155 @@
+import os
+import sys
+# Same path setup as Main.py so the src.* imports resolve
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+
+import pytest
+from flask import Flask, jsonify
+from src.routes.limiter import limiter_bp, AdmissionController, TokenBucket
+
+
+def test_token_bucket_drains_and_refills():
+    bucket = TokenBucket(rate=2.0, capacity=2, now=0.0)
+
+    assert bucket.take(0.0) == 0
+    assert bucket.take(0.0) == 0
+    assert bucket.take(0.0) == pytest.approx(0.5)
+
+    # Half a second at 2 tokens/s buys exactly one more request
+    assert bucket.take(0.5) == 0
+    assert bucket.take(0.5) == pytest.approx(0.5)
+
+
+def test_token_bucket_refill_and_refund_cap_at_capacity():
+    bucket = TokenBucket(rate=1.0, capacity=3, now=0.0)
+    bucket.take(0.0)
+
+    bucket.take(100.0)
+    assert bucket.tokens == pytest.approx(2)
+
+    bucket.refund()
+    bucket.refund()
+    assert bucket.tokens == 3
+
+
+def create_app(**config):
+    app = Flask(__name__)
+    app.config['PROPAGATE_EXCEPTIONS'] = False
+    app.config.update(config)
+    app.register_blueprint(limiter_bp, url_prefix='/api')
+
+    @app.route('/api/things', methods=['GET', 'POST'])
+    def things():
+        return jsonify({'success': True})
+
+    @app.route('/api/broken', methods=['POST'])
+    def broken():
+        raise RuntimeError('boom')
+
+    controller = AdmissionController(app)
+    return app, controller
+
+
+def test_rate_limited_write_gets_429_with_retry_after():
+    app, controller = create_app(RATELIMIT_WRITE_RATE=0.4, RATELIMIT_WRITE_BURST=1)
+    client = app.test_client()
+
+    assert client.post('/api/things').status_code == 200
+
+    response = client.post('/api/things')
+    assert response.status_code == 429
+    assert response.get_json()['success'] is False
+    # 2.5s to the next token, rounded up to whole seconds
+    assert response.headers['Retry-After'] == '3'
+
+    assert controller.snapshot()['rejected_rate_write'] == 1
+    assert controller.snapshot()['inflight_writes'] == 0
+
+
+def test_reads_and_writes_use_separate_buckets():
+    app, controller = create_app(RATELIMIT_WRITE_RATE=0.1, RATELIMIT_WRITE_BURST=1)
+    client = app.test_client()
+
+    client.post('/api/things')
+    assert client.post('/api/things').status_code == 429
+    assert client.get('/api/things').status_code == 200
+
+
+def test_bucket_is_keyed_on_caller_not_resource():
+    app, controller = create_app(RATELIMIT_WRITE_RATE=0.1, RATELIMIT_WRITE_BURST=1)
+    client = app.test_client()
+
+    client.post('/api/things', json={'user_id': 1})
+    # A different claimed user id from the same address shares the bucket
+    assert client.post('/api/things', json={'user_id': 2}).status_code == 429
+    assert client.post(
+        '/api/things', json={'user_id': 1}, environ_base={'REMOTE_ADDR': '10.0.0.2'}
+    ).status_code == 200
+
+
+def test_write_slot_released_when_view_raises():
+    app, controller = create_app(RATELIMIT_MAX_INFLIGHT_WRITES=1, RATELIMIT_WRITE_BURST=10)
+    client = app.test_client()
+
+    assert client.post('/api/broken').status_code == 500
+    assert controller.snapshot()['inflight_writes'] == 0
+    # The single slot is free again
+    assert client.post('/api/things').status_code == 200
+    assert controller.snapshot()['peak_inflight_writes'] == 1
+
+
+def test_server_busy_does_not_charge_the_caller():
+    app, controller = create_app(
+        RATELIMIT_MAX_INFLIGHT_WRITES=1,
+        RATELIMIT_WRITE_BURST=1,
+        RATELIMIT_WRITE_RATE=0.001,
+        RATELIMIT_WRITE_QUEUE_TIMEOUT=0
+    )
+    client = app.test_client()
+
+    controller.write_slots.acquire()
+    response = client.post('/api/things')
+    assert response.status_code == 429
+    assert response.headers['Retry-After'] == '1'
+    assert controller.snapshot()['rejected_concurrency'] == 1
+    controller.write_slots.release()
+
+    # The refunded token is still there once the server has capacity
+    assert client.post('/api/things').status_code == 200
+
+
+def test_metrics_endpoint_is_not_rate_limited():
+    app, controller = create_app(RATELIMIT_READ_RATE=0.1, RATELIMIT_READ_BURST=1)
+    client = app.test_client()
+
+    for _ in range(3):
+        response = client.get('/api/limiter/metrics')
+        assert response.status_code == 200
+    assert response.get_json()['metrics']['admitted_read'] == 0
+
+
+def test_prune_keeps_throttled_buckets():
+    app, controller = create_app(RATELIMIT_MAX_BUCKETS=2, RATELIMIT_READ_RATE=1.0, RATELIMIT_READ_BURST=1)
+
+    throttled = controller.bucket('read', 'ip:abuser', 0.0)
+    throttled.take(0.0)
+    controller.bucket('read', 'ip:idle', 0.0)
+
+    # Table is full; the idle bucket has refilled and goes, the throttled one stays
+    controller.bucket('read', 'ip:new', 0.5)
+    assert ('read', 'ip:abuser') in controller.buckets
+    assert ('read', 'ip:idle') not in controller.buckets
+    assert ('read', 'ip:new') in controller.buckets
+
+
+def test_prune_evicts_only_least_recently_used_when_all_throttled():
+    app, controller = create_app(RATELIMIT_MAX_BUCKETS=2, RATELIMIT_READ_RATE=0.001, RATELIMIT_READ_BURST=1)
+
+    controller.bucket('read', 'ip:a', 0.0).take(0.0)
+    controller.bucket('read', 'ip:b', 0.0).take(0.0)
+    # Touch a so b becomes least recently used
+    controller.bucket('read', 'ip:a', 1.0)
+
+    controller.bucket('read', 'ip:c', 1.0)
+    assert list(controller.buckets) == [('read', 'ip:a'), ('read', 'ip:c')]
+    assert controller.buckets[('read', 'ip:a')].tokens < 1